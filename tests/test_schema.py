@@ -0,0 +1,108 @@
+import unittest
+
+from w3up.ucanto.core.schema.schema import (
+    BaseSchema,
+    ElementError,
+    FieldError,
+    TypeError_,
+    UnionError,
+    array,
+    dictionary,
+    integer,
+    number,
+    string,
+)
+
+
+class MyList(list):
+    pass
+
+
+class ArrayOfTest(unittest.TestCase):
+    def test_reads_exact_list(self):
+        result = array(string()).read(["a", "b"])
+        self.assertEqual(result.ok, ["a", "b"])
+        self.assertIsNone(result.error)
+
+    def test_rejects_list_subclass(self):
+        result = array(string()).read(MyList(["a"]))
+        self.assertIsInstance(result.error, TypeError_)
+        self.assertEqual(
+            result.error.message,
+            "Expected value of type array instead got MyList",
+        )
+
+    def test_reports_first_failing_index_with_repeated_elements(self):
+        bad = object()
+        result = array(string()).read(["a", "a", bad, bad])
+        self.assertIsInstance(result.error, ElementError)
+        self.assertEqual(result.error.index, 2)
+
+    def test_element_error_message(self):
+        result = array(integer()).read([1, 1, "x"])
+        self.assertEqual(
+            result.error.message,
+            "Array contains invalid element at 2:\n"
+            '  - Expected value of type integer instead got "x"',
+        )
+        self.assertEqual(str(result.error), result.error.message)
+
+    def test_converts_ints_for_number_elements(self):
+        result = array(number()).read([1, 2.5])
+        self.assertEqual(result.ok, [1.0, 2.5])
+        self.assertEqual([type(value) for value in result.ok], [float, float])
+
+    def test_accepts_schema_without_fast_reader(self):
+        self.assertEqual(type(BaseSchema(None).array()).__name__, "ArrayOf")
+
+
+class DictionaryTest(unittest.TestCase):
+    def test_drops_none_values(self):
+        result = dictionary(string().optional()).read({"a": None, "b": "c"})
+        self.assertEqual(result.ok, {"b": "c"})
+
+    def test_rejects_none_for_required_values(self):
+        result = dictionary(string()).read({"a": None})
+        self.assertIsInstance(result.error, FieldError)
+        self.assertEqual(
+            result.error.message,
+            "Object contains invalid field 'a':\n"
+            "  - Expected value of type string instead got null",
+        )
+
+    def test_rejects_non_dict(self):
+        result = dictionary(string()).read([])
+        self.assertEqual(
+            result.error.message,
+            "Expected value of type dictionary instead got array",
+        )
+
+
+class LeafTest(unittest.TestCase):
+    def test_number_converts_int_to_float(self):
+        result = number().read(1)
+        self.assertEqual(result.ok, 1.0)
+        self.assertIs(type(result.ok), float)
+
+    def test_is_valid_agrees_with_read(self):
+        schema = number()
+        with self.assertRaises(OverflowError):
+            schema.read(10**400)
+        with self.assertRaises(OverflowError):
+            schema.is_valid(10**400)
+        self.assertTrue(integer().is_valid(True))
+        self.assertFalse(string().is_valid(1))
+
+    def test_nullable_union_message(self):
+        result = string().nullable().read(3)
+        self.assertIsInstance(result.error, UnionError)
+        self.assertEqual(
+            result.error.message,
+            "Value does not match any type of the union:\n"
+            "  - Expected value of type string instead got 3\n"
+            "  - Expected value of type null instead got 3",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
 from typing import Sequence, List
 from core.interfaces.base import ConnectionOptions
 
+# Error attributes that are set explicitly on the error receipt payload
+_SKIPPED_ERROR_FIELDS = frozenset(("message", "name"))
+
+# Attribute values that can be carried in an IPLD-encoded receipt payload
+_SERIALIZABLE_TYPES = (str, int, float, bool, type(None), bytes, list, dict)
+
 
 # TODO: missing a lot of imports, fix those
 class Connection:
@@ -22,37 +28,41 @@ class Connection:
         # Attempt to decode response
         try:
             output = self.codec.decode(response)
-            receipts = [output.get(link) for link in input_msg.invocation_links]
-            return receipts
+            return list(map(output.get, input_msg.invocation_links))
 
         except Exception as error:
             # Create error receipts if decode fails
-            receipts = []
-
-            # Extract error details
+            # Extract error details from the instance dict, keeping only public
+            # attributes that the receipt payload can encode
+            extra = (
+                {
+                    k: v
+                    for k, v in vars(error).items()
+                    if k not in _SKIPPED_ERROR_FIELDS
+                    and not k.startswith("_")
+                    and isinstance(v, _SERIALIZABLE_TYPES)
+                }
+                if hasattr(error, "__dict__")
+                else {}
+            )
             error_dict = {
                 "message": str(error),
                 "name": error.__class__.__name__,
-                **{
-                    k: v
-                    for k, v in asdict(error).items()
-                    if k not in ["message", "name"]
-                },
+                **extra,
             }
 
-            # Create error receipt for each invocation
-            for ran in input_msg.invocation_links:
-                # Create dummy signer
-                dummy_signer = DummySigner(
-                    did=lambda: self.id.did(),
-                    sign=lambda: Signature.create_non_standard("", bytes()),
-                )
-
-                # Issue error receipt
-                receipt = Receipt.issue(
-                    ran=ran, result={"error": error_dict}, issuer=dummy_signer
-                )
+            # The dummy signer and error payload are identical for every
+            # invocation, so build them once and reuse across receipts.
+            issuer_did = self.id.did()
+            signature = Signature.create_non_standard("", bytes())
+            dummy_signer = DummySigner(
+                did=lambda did=issuer_did: did,
+                sign=lambda signature=signature: signature,
+            )
+            error_result = {"error": error_dict}
 
-                receipts.append(receipt)
-
-            return receipts
+            # Create error receipt for each invocation
+            return [
+                Receipt.issue(ran=ran, result=error_result, issuer=dummy_signer)
+                for ran in input_msg.invocation_links
+            ]
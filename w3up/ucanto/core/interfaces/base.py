@@ -8,6 +8,7 @@ from typing import (
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+import sys
 import libipld
 from multiformats import CID, multicodec, multihash, multibase
 
@@ -31,26 +32,26 @@ class SignatureAlgorithm(Enum):
     Secp256k1 = 'Secp256k1'
     RSA = 'RSA'
 
-@dataclass
+@dataclass(slots=True)
 class ByteView(Generic[T]):
     """Represents byte encoded data"""
     bytes: bytes
     encoding: str
 
-@dataclass
+@dataclass(slots=True)
 class SignatureView:
     """View of a cryptographic signature"""
     bytes: bytes
     algorithm: SignatureAlgorithm
 
-@dataclass 
+@dataclass(slots=True)
 class Block(Generic[T]):
     """IPLD block with encoded data"""
     cid: CID
     bytes: bytes
     value: T
 
-@dataclass
+@dataclass(slots=True)
 class Fact:
     """Arbitrary facts that can be included in a UCAN"""
     uri: str
@@ -63,14 +64,20 @@ class Principal(Protocol):
         """Returns DID of the principal"""
         ...
         
-@dataclass
+@dataclass(slots=True)
 class Capability:
     """Represents a UCAN capability"""
     with_: Resource  # Resource identifier
     can: Ability    # Action that can be performed
     nb: Optional[Dict[str, Any]] = None  # Caveats
 
-@dataclass
+    def __post_init__(self) -> None:
+        # Resources and abilities repeat across invocations, intern them so
+        # comparisons and dict lookups hit the identity fast path
+        self.with_ = sys.intern(self.with_)
+        self.can = sys.intern(self.can)
+
+@dataclass(slots=True)
 class UCANOptions:
     """Base options for UCAN creation"""
     audience: Principal
@@ -82,7 +89,7 @@ class UCANOptions:
     proofs: Optional[List['Proof']] = None
     attached_blocks: Optional[Dict[str, Block]] = None
 
-@dataclass
+@dataclass(slots=True)
 class DelegationOptions(UCANOptions):
     """Options for delegating capabilities"""
     issuer: 'Signer'
@@ -144,7 +151,7 @@ class Signer(Protocol):
         """Verify a signature"""
         ...
 
-@dataclass
+@dataclass(slots=True)
 class ValidatorOptions:
     """Options for UCAN validation"""
     principal_parser: Optional['PrincipalParser'] = None
@@ -157,7 +164,7 @@ class ValidatorOptions:
         ...
 
 # Result types        
-@dataclass
+@dataclass(slots=True)
 class Ok(Generic[T]):
     """Successful result"""
     value: T
@@ -170,13 +177,13 @@ class Error(Generic[X], Exception):
 Result = Union[Ok[T], Error[X]]
 
 # Receipt types
-@dataclass
+@dataclass(slots=True)
 class ReceiptModel(Generic[T, X]):
     """Model for capability invocation receipts"""
     outcome: 'OutcomeModel[T, X]'
     signature: SignatureView
 
-@dataclass
+@dataclass(slots=True)
 class OutcomeModel(Generic[T, X]):
     """Model for invocation outcomes"""
     ran: CID  # Invocation CID
@@ -186,7 +193,7 @@ class OutcomeModel(Generic[T, X]):
     issuer: Optional[DID] = None
     proofs: List[CID] = None
 
-@dataclass
+@dataclass(slots=True)
 class EffectsModel:
     """Model for capability effects"""
     fork: List[CID]  # Links to forked invocations
@@ -219,7 +226,7 @@ class OutboundCodec(Protocol):
         """Decode inbound response""" 
         ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionOptions:
     """Options for UCAN connections"""
     id: Principal
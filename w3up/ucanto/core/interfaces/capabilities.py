@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+import sys
 from typing import (
     TypeVar,
     Generic,
@@ -36,7 +37,7 @@ UCANLink = Any  # Link type from IPLD
 Result = Union["Ok[T]", "Error"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """Source of a capability claim"""
 
@@ -44,7 +45,7 @@ class Source:
     delegation: "Delegation"
 
 
-@dataclass
+@dataclass(slots=True)
 class Match(Generic[T, M]):
     """Match result for capability validation"""
 
@@ -67,7 +68,7 @@ class Matcher(Protocol[M]):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Select(Generic[M]):
     """Selection of matched capabilities"""
 
@@ -91,11 +92,10 @@ class Caveats:
     """Arbitrary capability caveats"""
 
     def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        self.__dict__.update(kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedCapability(Generic[A, R, C]):
     """Parsed capability with typed components"""
 
@@ -104,21 +104,21 @@ class ParsedCapability(Generic[A, R, C]):
     nb: Optional[C] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectMatch(Match[T, "DirectMatch[T]"]):
     """Direct capability match"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DerivedMatch(Match[T, Union[M, "DerivedMatch[T, M]"]]):
     """Match derived from another capability"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Capability:
     """Raw capability data"""
 
@@ -126,6 +126,12 @@ class Capability:
     with_: Resource
     nb: Optional[Dict[str, Any]] = None
 
+    def __post_init__(self) -> None:
+        # Abilities and resources repeat across invocations, intern them so
+        # parser lookups compare by identity
+        self.can = sys.intern(self.can)
+        self.with_ = sys.intern(self.with_)
+
 
 class CapabilityParser(Protocol[M]):
     """Protocol for parsing and validating capabilities"""
@@ -259,7 +265,7 @@ class Validator(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationOptions:
     """Options for capability validation"""
 
@@ -270,7 +276,7 @@ class ValidationOptions:
     resolver: Optional[ProofResolver] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Authorization:
     """Authorized capability with proof chain"""
 
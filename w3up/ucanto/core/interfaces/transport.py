@@ -1,3 +1,4 @@
+import operator
 from dataclasses import dataclass
 from typing import (
     TypeVar, Generic, Protocol, Dict, List, Optional, 
@@ -20,40 +21,44 @@ Tuple: TypeAlias = Sequence[T]  # Non-empty tuple type
 HTTPHeaders: TypeAlias = Mapping[str, str]
 Await: TypeAlias = Awaitable[T]
 
-@dataclass
+@dataclass(slots=True)
 class EncodeOptions:
     """Options for encoding operations"""
     hasher: Optional['MultihashHasher'] = None
 
-@dataclass 
+@dataclass(slots=True)
 class RequestEncodeOptions(EncodeOptions):
     """Options for encoding HTTP requests"""
     accept: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ByteView(Generic[T]):
     """Byte encoded data view"""
     bytes: bytes
     encoding: str
     value: T
 
-@dataclass
+@dataclass(slots=True)
 class Block(Generic[T, Format, Alg, V]):
-    """IPLD block with optional decoded data"""
+    """IPLD block with optional decoded data
+
+    bytes may be a memoryview slice of the response body it was decoded
+    from, call bytes() on it to take an owned copy.
+    """
     cid: CID
-    bytes: bytes
+    bytes: Union[bytes, memoryview]
     codec: Multicodec
     multihash: Multihash
     data: Optional[T] = None
 
-@dataclass
+@dataclass(slots=True)
 class HTTPRequest(Generic[T]):
     """HTTP request with typed body"""
     method: str = 'POST'
     headers: HTTPHeaders = None
     body: ByteView[T] = None
 
-@dataclass
+@dataclass(slots=True)
 class HTTPResponse(Generic[T]):
     """HTTP response with typed body"""
     status: int = 200
@@ -161,9 +166,11 @@ class UCANTransport:
         return result.data['receipt']
 
 # Type inference helpers
+_get_invocation = operator.attrgetter('invocation')
+
 def infer_invocations(invocations: Tuple['ServiceInvocation']) -> Tuple['Invocation']:
     """Helper to infer invocation types"""
-    return tuple(i.invocation for i in invocations)
+    return tuple(map(_get_invocation, invocations))
 
 def infer_receipts(
     invocations: Tuple['ServiceInvocation'],
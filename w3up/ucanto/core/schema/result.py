@@ -1,5 +1,5 @@
 from typing import Dict, Any
-import json
+import traceback
 
 
 class Failure(Exception):
@@ -12,17 +12,17 @@ class Failure(Exception):
         """Returns the failure message."""
         return self.__str__()
 
-    def to_json(self) -> Dict[str, str]:
+    def to_json(self, include_stack: bool = False) -> Dict[str, str]:
         """
         Returns a JSON-serializable representation of the failure.
+
+        The stack is only formatted when include_stack is set, since that
+        reads the source lines of every frame.
         """
-        return json.dumps(
-            {
-                "name": self.__class__.__name__,
-                "message": self.message,
-                "stack": getattr(self, "__traceback__", None).__str__(),
-            }
-        )
+        data = {"name": self.__class__.__name__, "message": self.message}
+        if include_stack and self.__traceback__ is not None:
+            data["stack"] = "".join(traceback.format_tb(self.__traceback__))
+        return data
 
 
 def ok(value: Any) -> Dict[str, Any]:
@@ -1,15 +1,25 @@
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar('T')
+I = TypeVar('I')  # noqa: E741
+O = TypeVar('O')  # noqa: E741
+V = TypeVar('V')
+Settings = TypeVar('Settings')
 
 
 class BaseSchema:
+    __slots__ = ("settings",)
+
     def __init__(self, settings) -> None:
         self.settings = settings
 
-    def read_with(self, input_value: I, settings: Settings) -> Result:
+    def read_with(self, input_value: I, settings: Settings) -> "Result":
         """Validate input with settings"""
         pass
 
-    def read(self, input_value: I) -> Result:
+    def read(self, input_value: I) -> "Result":
         """Validate input value"""
         return self.read_with(input_value, self.settings)
 
@@ -38,7 +48,7 @@ class BaseSchema:
         return ArrayOf(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Represents a validation result"""
 
@@ -49,9 +59,18 @@ class Result:
 class SchemaError(Exception):
     """Base class for schema validation errors"""
 
+    __slots__ = ("_message",)
+
     def __init__(self, message: str = "") -> None:
-        self.message = message
-        super().__init__(self.message)
+        self._message = message
+        super().__init__(message)
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+    def __str__(self) -> str:
+        return self.message
 
     @property
     def name(self) -> str:
@@ -64,6 +83,11 @@ class SchemaError(Exception):
 class API(ABC, Generic[T, I, Settings]):
     """Base class for all schema validators"""
 
+    __slots__ = ("settings",)
+
+    # Exact type of inputs this schema accepts unchanged, if it has one
+    _exact_type: Optional[type] = None
+
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings
 
@@ -79,10 +103,16 @@ class API(ABC, Generic[T, I, Settings]):
         """Validate input value"""
         return self.read_with(input_value, self.settings)
 
+    def _read_fast(self, input_value: I) -> Tuple[Any, Optional["SchemaError"]]:
+        """Validate input value into an (ok, error) pair"""
+        result = self.read(input_value)
+        return result.ok, result.error
+
     def is_valid(self, value: Any) -> bool:
         """Check if value matches schema"""
-        result = self.read(value)
-        return result.error is None
+        # Shares the reader's checks so both always agree
+        _, error = self._read_fast(value)
+        return error is None
 
     def from_value(self, value: Any) -> T:
         """Convert value to schema type"""
@@ -107,6 +137,8 @@ class API(ABC, Generic[T, I, Settings]):
 class Never(API[None, I, None]):
     """Schema that never matches"""
 
+    __slots__ = ()
+
     def read_with(self, input_value: I, settings: None) -> Result:
         return Result(error=TypeError_("never", input_value))
 
@@ -117,9 +149,14 @@ class Never(API[None, I, None]):
 class Unknown(API[Any, I, None]):
     """Schema that matches anything"""
 
+    __slots__ = ()
+
     def read_with(self, input_value: I, settings: None) -> Result:
         return Result(ok=input_value)
 
+    def _read_fast(self, input_value: I) -> Tuple[Any, None]:
+        return input_value, None
+
     def __str__(self) -> str:
         return "unknown()"
 
@@ -127,13 +164,17 @@ class Unknown(API[Any, I, None]):
 class Nullable(API[Optional[O], I, API[O, I, Any]]):
     """Schema for nullable values"""
 
+    __slots__ = ()
+
     def read_with(self, input_value: I, reader: API[O, I, Any]) -> Result:
         if input_value is None:
             return Result(ok=None)
         result = reader.read(input_value)
         if result.error:
             return Result(
-                error=UnionError([result.error, TypeError_("null", input_value)])
+                error=UnionError(
+                    lambda: [result.error, TypeError_("null", input_value)]
+                )
             )
         return result
 
@@ -144,6 +185,8 @@ class Nullable(API[Optional[O], I, API[O, I, Any]]):
 class Optional_(API[Optional[O], I, API[O, I, Any]]):
     """Schema for optional values"""
 
+    __slots__ = ()
+
     def read_with(self, input_value: I, reader: API[O, I, Any]) -> Result:
         if input_value is None:
             return Result(ok=None)
@@ -154,20 +197,64 @@ class Optional_(API[Optional[O], I, API[O, I, Any]]):
         return f"{self.settings}.optional()"
 
 
+def _fast_reader(schema: Any) -> Callable[[Any], Any]:
+    """Get the (ok, error) reader of a schema, wrapping read() if it has none"""
+    read_fast = getattr(schema, "_read_fast", None)
+    if read_fast is not None:
+        return read_fast
+    read = schema.read
+
+    def read_fast(input_value: Any):
+        result = read(input_value)
+        return result.ok, result.error
+
+    return read_fast
+
+
 class ArrayOf(API[List[O], I, API[O, I, Any]]):
     """Schema for arrays"""
 
-    def read_with(self, input_value: I, schema: API[O, I, Any]) -> Result:
-        if not isinstance(input_value, list):
-            return Result(error=TypeError_("array", input_value))
+    __slots__ = ("_reader",)
+
+    def __init__(self, settings: API[O, I, Any]):
+        super().__init__(settings)
+        self._reader = self.compile(settings)
 
-        results = []
-        for index, value in enumerate(input_value):
-            result = schema.read(value)
-            if result.error:
-                return Result(error=ElementError(index, result.error))
-            results.append(result.ok)
-        return Result(ok=results)
+    def read(self, input_value: I) -> Result:
+        return self._reader(input_value)
+
+    def read_with(self, input_value: I, schema: API[O, I, Any]) -> Result:
+        return self.compile(schema)(input_value)
+
+    def compile(self, schema: API[O, I, Any]) -> Callable[[I], Result]:
+        """Build a reader specialized to the element schema"""
+        read_element = _fast_reader(schema)
+        exact_type = getattr(schema, "_exact_type", None)
+
+        def read(input_value: I) -> Result:
+            if type(input_value) is not list:
+                return Result(error=TypeError_("array", input_value))
+
+            # Arrays of primitives usually match exactly, check them in one
+            # pass and only fall back to reading each element on a mismatch
+            if exact_type is not None and all(
+                type(value) is exact_type for value in input_value
+            ):
+                return Result(ok=list(input_value))
+
+            results = []
+            for value in input_value:
+                ok, error = read_element(value)
+                if error:
+                    # Only locate the element's position once it has failed
+                    index = next(
+                        i for i, item in enumerate(input_value) if item is value
+                    )
+                    return Result(error=ElementError(index, error))
+                results.append(ok)
+            return Result(ok=results)
+
+        return read
 
     @property
     def element(self):
@@ -180,24 +267,54 @@ class ArrayOf(API[List[O], I, API[O, I, Any]]):
 class Dictionary(API[Dict[str, V], I, Dict[str, Any]]):
     """Schema for dictionary objects"""
 
+    __slots__ = ("_reader",)
+
+    def __init__(self, settings: Dict[str, Any]):
+        super().__init__(settings)
+        self._reader = self.compile(settings)
+
+    def read(self, input_value: I) -> Result:
+        return self._reader(input_value)
+
     def read_with(self, input_value: I, settings: Dict[str, Any]) -> Result:
-        if not isinstance(input_value, dict):
-            return Result(error=TypeError_("dictionary", input_value))
+        return self.compile(settings)(input_value)
+
+    def compile(self, settings: Dict[str, Any]) -> Callable[[I], Result]:
+        """Build a reader specialized to the key and value schemas"""
+        read_key = _fast_reader(settings["key"])
+        read_value = _fast_reader(settings["value"])
+        key_type = getattr(settings["key"], "_exact_type", None)
+        value_type = getattr(settings["value"], "_exact_type", None)
+        exact = key_type is not None and value_type is not None
+
+        def read(input_value: I) -> Result:
+            if not isinstance(input_value, dict):
+                return Result(error=TypeError_("dictionary", input_value))
 
-        result = {}
-        for key, value in input_value.items():
-            key_result = settings["key"].read(key)
-            if key_result.error:
-                return Result(error=FieldError(key, key_result.error))
+            # Entries of primitive schemas pass through unchanged when every
+            # key and value has the exact type, so copy them in one go
+            if exact and all(
+                type(key) is key_type and type(value) is value_type
+                for key, value in input_value.items()
+            ):
+                return Result(ok=dict(input_value))
 
-            value_result = settings["value"].read(value)
-            if value_result.error:
-                return Result(error=FieldError(key, value_result.error))
+            result = {}
+            for key, value in input_value.items():
+                key_ok, key_error = read_key(key)
+                if key_error:
+                    return Result(error=FieldError(key, key_error))
 
-            if value_result.ok is not None:
-                result[key_result.ok] = value_result.ok
+                value_ok, value_error = read_value(value)
+                if value_error:
+                    return Result(error=FieldError(key, value_error))
 
-        return Result(ok=result)
+                if value_ok is not None:
+                    result[key_ok] = value_ok
+
+            return Result(ok=result)
+
+        return read
 
     def __str__(self) -> str:
         return f"dictionary({self.settings})"
@@ -206,59 +323,102 @@ class Dictionary(API[Dict[str, V], I, Dict[str, Any]]):
 class TypeError_(SchemaError):
     """Type mismatch error"""
 
+    __slots__ = ("expect", "actual")
+
     def __init__(self, expect: str, actual: Any):
         self.expect = expect
         self.actual = actual
-        super().__init__(
-            f"Expected value of type {expect} instead got {to_string(actual)}"
+        # Skip storing a message, it is only formatted when surfaced
+        super(SchemaError, self).__init__(expect, actual)
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Expected value of type {self.expect} "
+            f"instead got {to_string(self.actual)}"
         )
 
 
 class UnionError(SchemaError):
     """Union type mismatch error"""
 
-    def __init__(self, causes: List[SchemaError]):
-        self.causes = causes
-        messages = "\n".join(f"  - {cause.message}" for cause in causes)
-        super().__init__(f"Value does not match any type of the union:\n{messages}")
+    __slots__ = ("_causes",)
+
+    def __init__(
+        self, causes: Union[List[SchemaError], Callable[[], List[SchemaError]]]
+    ):
+        # Causes may be given as a factory, built when first inspected
+        self._causes = causes
+        super(SchemaError, self).__init__()
+
+    @property
+    def causes(self) -> List[SchemaError]:
+        if callable(self._causes):
+            self._causes = self._causes()
+        return self._causes
+
+    @property
+    def message(self) -> str:
+        messages = "\n".join(f"  - {cause.message}" for cause in self.causes)
+        return f"Value does not match any type of the union:\n{messages}"
 
 
 class ElementError(SchemaError):
     """Array element error"""
 
+    __slots__ = ("index", "cause")
+
     def __init__(self, index: int, cause: SchemaError):
         self.index = index
         self.cause = cause
-        super().__init__(
-            f"Array contains invalid element at {index}:\n  - {cause.message}"
+        super(SchemaError, self).__init__(index, cause)
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Array contains invalid element at {self.index}:\n"
+            f"  - {self.cause.message}"
         )
 
 
 class FieldError(SchemaError):
     """Dictionary field error"""
 
+    __slots__ = ("key", "cause")
+
     def __init__(self, key: str, cause: SchemaError):
         self.key = key
         self.cause = cause
-        super().__init__(f"Object contains invalid field '{key}':\n  - {cause.message}")
+        super(SchemaError, self).__init__(key, cause)
+
+    @property
+    def message(self) -> str:
+        return f"Object contains invalid field '{self.key}':\n  - {self.cause.message}"
+
+
+# Formatters for error messages, keyed by exact type
+_TO_STRING: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "null",
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: lambda value: f'"{value}"',
+    list: lambda value: "array",
+    dict: lambda value: "object",
+}
 
 
 def to_string(value: Any) -> str:
     """Convert value to string representation"""
-    if value is None:
-        return "null"
-    elif isinstance(value, bool):
-        return str(value).lower()
-    elif isinstance(value, (int, float)):
-        return str(value)
-    elif isinstance(value, str):
-        return f'"{value}"'
-    elif isinstance(value, list):
-        return "array"
-    elif isinstance(value, dict):
-        return "object"
-    else:
+    format_value = _TO_STRING.get(type(value))
+    if format_value is None:
+        for kind, format_kind in _TO_STRING.items():
+            # ArrayOf rejects list subclasses, so name them rather than
+            # calling them arrays
+            if kind is not list and isinstance(value, kind):
+                return format_kind(value)
         return type(value).__name__
+    return format_value(value)
 
 
 # Factory functions
@@ -292,37 +452,64 @@ def dictionary(
 class String(API[str, Any, None]):
     """String schema validator"""
 
+    __slots__ = ()
+    _exact_type = str
+
     def read_with(self, input_value: Any, settings: None) -> Result:
-        if isinstance(input_value, str):
-            return Result(ok=input_value)
-        return Result(error=TypeError_("string", input_value))
+        return Result(*self._read_fast(input_value))
+
+    def _read_fast(self, input_value: Any) -> Tuple[Any, Optional[SchemaError]]:
+        # Check the exact type first, subclasses still pass via isinstance
+        if type(input_value) is str or isinstance(input_value, str):
+            return input_value, None
+        return None, TypeError_("string", input_value)
 
 
 class Number(API[float, Any, None]):
     """Number schema validator"""
 
+    __slots__ = ()
+    _exact_type = float
+
     def read_with(self, input_value: Any, settings: None) -> Result:
-        if isinstance(input_value, (int, float)):
-            return Result(ok=float(input_value))
-        return Result(error=TypeError_("number", input_value))
+        return Result(*self._read_fast(input_value))
+
+    def _read_fast(self, input_value: Any) -> Tuple[Any, Optional[SchemaError]]:
+        t = type(input_value)
+        if t is float or t is int or isinstance(input_value, (int, float)):
+            return float(input_value), None
+        return None, TypeError_("number", input_value)
 
 
 class Boolean(API[bool, Any, None]):
     """Boolean schema validator"""
 
+    __slots__ = ()
+    _exact_type = bool
+
     def read_with(self, input_value: Any, settings: None) -> Result:
-        if isinstance(input_value, bool):
-            return Result(ok=input_value)
-        return Result(error=TypeError_("boolean", input_value))
+        return Result(*self._read_fast(input_value))
+
+    def _read_fast(self, input_value: Any) -> Tuple[Any, Optional[SchemaError]]:
+        # bool cannot be subclassed, so an exact check is equivalent
+        if type(input_value) is bool:
+            return input_value, None
+        return None, TypeError_("boolean", input_value)
 
 
 class Integer(API[int, Any, None]):
     """Integer schema validator"""
 
+    __slots__ = ()
+    _exact_type = int
+
     def read_with(self, input_value: Any, settings: None) -> Result:
-        if isinstance(input_value, int):
-            return Result(ok=input_value)
-        return Result(error=TypeError_("integer", input_value))
+        return Result(*self._read_fast(input_value))
+
+    def _read_fast(self, input_value: Any) -> Tuple[Any, Optional[SchemaError]]:
+        if type(input_value) is int or isinstance(input_value, int):
+            return input_value, None
+        return None, TypeError_("integer", input_value)
 
 
 # Factory functions for basic types
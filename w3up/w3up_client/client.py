@@ -1,10 +1,22 @@
 from abc import ABC
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Union, Iterable
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    Iterable,
+)
 from urllib.parse import URL
 import asyncio
 from enum import Enum
 import json
+import sys
 
 # Type aliases
 DID = str
@@ -18,6 +30,13 @@ UnknownLink = bytes  # Multiformats CID type
 BlobLike = Union[bytes, bytearray, "Blob"]  # File-like objects
 FileLike = Union[str, bytes, "File"]  # File-like objects
 
+# Capabilities required to upload content into a space. Ability names contain
+# "/" so the compiler doesn't intern them, do it here for identity compares.
+_UPLOAD_CAPS = tuple(
+    sys.intern(ability)
+    for ability in ("space/blob/add", "space/index/add", "filecoin/offer", "upload/add")
+)
+
 
 @dataclass
 class ServiceConf:
@@ -66,12 +85,16 @@ class Base:
         self._agent = agent_data
         self._service_conf = options.get("serviceConf") if options else None
         self._receipts_endpoint = options.get("receiptsEndpoint") if options else None
+        # Normalize the endpoint once rather than on every receipt poll
+        self._receipts_endpoint_str = (
+            str(URL(self._receipts_endpoint)) if self._receipts_endpoint else None
+        )
 
-    async def _invocation_config(self, capabilities: List[str]) -> dict:
+    async def _invocation_config(self, capabilities: Sequence[str]) -> dict:
         """Generate config for capability invocation"""
         return {
             "issuer": self._agent,
-            "with": self.currentSpace().did() if self.currentSpace() else None,
+            "with": self._agent.current_space(),
             "proofs": self.proofs(capabilities),
         }
 
@@ -82,6 +105,11 @@ class Client(Base):
     def __init__(self, agent_data: dict, options: Optional[dict] = None):
         super().__init__(agent_data, options)
 
+        # Space accessors are used by every space switch and share, bind them
+        # once here rather than for each capability client
+        self._agent_cur_space = agent_data.current_space
+        self._agent_set_space = agent_data.set_current_space
+
         # Initialize capability clients
         self.capability = {
             "access": AccessClient(agent_data, options),
@@ -118,49 +146,41 @@ class Client(Base):
         """List accessible accounts"""
         return Account.list(self)
 
+    async def _prepare_upload(
+        self, options: Optional[UploadOptions], options_cls: type
+    ) -> Tuple[dict, UploadOptions]:
+        """Resolve the invocation config and options shared by uploads"""
+        conf = await self._invocation_config(_UPLOAD_CAPS)
+        options = options or options_cls()
+        options.connection = self._service_conf.upload
+        return conf, options
+
     async def upload_file(
         self, file: BlobLike, options: Optional[UploadFileOptions] = None
     ) -> UnknownLink:
         """Upload a single file"""
-        conf = await self._invocation_config(
-            ["space/blob/add", "space/index/add", "filecoin/offer", "upload/add"]
-        )
-
-        if options:
-            options.connection = self._service_conf.upload
-
-        return await upload_file(conf, file, options or UploadFileOptions())
+        conf, options = await self._prepare_upload(options, UploadFileOptions)
+        return await upload_file(conf, file, options)
 
     async def upload_directory(
         self, files: List[FileLike], options: Optional[UploadDirectoryOptions] = None
     ) -> UnknownLink:
         """Upload a directory of files"""
-        conf = await self._invocation_config(
-            ["space/blob/add", "space/index/add", "filecoin/offer", "upload/add"]
-        )
-
-        if options:
-            options.connection = self._service_conf.upload
-
-        return await upload_directory(conf, files, options or UploadDirectoryOptions())
+        conf, options = await self._prepare_upload(options, UploadDirectoryOptions)
+        return await upload_directory(conf, files, options)
 
     async def upload_car(
         self, car: BlobLike, options: Optional[UploadOptions] = None
     ) -> UnknownLink:
         """Upload a CAR file"""
-        conf = await self._invocation_config(
-            ["space/blob/add", "space/index/add", "filecoin/offer", "upload/add"]
-        )
-
-        if options:
-            options.connection = self._service_conf.upload
-
-        return await upload_car(conf, car, options or UploadOptions())
+        conf, options = await self._prepare_upload(options, UploadOptions)
+        return await upload_car(conf, car, options)
 
     async def get_receipt(self, task_cid: UnknownLink) -> dict:
         """Get receipt for completed task"""
-        receipts_endpoint = str(URL(self._receipts_endpoint))
-        return await Receipt.poll(task_cid, {"receiptsEndpoint": receipts_endpoint})
+        return await Receipt.poll(
+            task_cid, {"receiptsEndpoint": self._receipts_endpoint_str}
+        )
 
     def default_provider(self) -> str:
         """Get default provider DID"""
@@ -177,14 +197,18 @@ class Client(Base):
 
     async def set_current_space(self, did: DID) -> None:
         """Set current space"""
-        await self._agent.set_current_space(did)
+        await self._agent_set_space(did)
 
-    def spaces(self) -> List["Space"]:
-        """Get all available spaces"""
-        return [
-            Space(id=id_, meta=meta, agent=self._agent)
-            for id_, meta in self._agent.spaces.items()
-        ]
+    def spaces(self) -> Iterator["Space"]:
+        """Iterate over all available spaces
+
+        The result is an iterator and always truthy, use list() on it to
+        check whether any spaces exist.
+        """
+        agent = self._agent
+        # Snapshot the entries so spaces can be added while iterating
+        items = list(agent.spaces.items())
+        return (Space(id=id_, meta=meta, agent=agent) for id_, meta in items)
 
     async def create_space(self, name: str, options: dict = {}) -> "OwnedSpace":
         """Create a new space"""
@@ -238,14 +262,14 @@ class Client(Base):
             }
 
         abilities = options.get("abilities", [])
-        current_space = self.agent.current_space()
+        current_space = self._agent_cur_space()
 
         try:
             # Set space context
-            await self.agent.set_current_space(space_did)
+            await self._agent_set_space(space_did)
 
             # Create delegation
-            delegation_data = await self.agent.delegate(
+            delegation_data = await self._agent.delegate(
                 {
                     **options,
                     "abilities": abilities,
@@ -279,13 +303,13 @@ class Client(Base):
         finally:
             # Restore original space
             if current_space and current_space != space_did:
-                await self.agent.set_current_space(current_space)
+                await self._agent_set_space(current_space)
 
     async def add_space(self, proof: Delegation) -> None:
         """Add space from proof"""
         return await self._agent.import_space_from_delegation(proof)
 
-    def proofs(self, caps: Optional[List[Capability]] = None) -> List[Delegation]:
+    def proofs(self, caps: Optional[Sequence[Capability]] = None) -> List[Delegation]:
         """Get matching capability proofs"""
         return self._agent.proofs(caps)
 